@@ -2,31 +2,130 @@
 This module provides basic file operations and data manipulation utilities.
 """
 
+import mmap
+import os
+from itertools import chain
 
-def read_file(path):
+_READ_CHUNK = 64 * 1024
+_FADVISE_THRESHOLD = 1024 * 1024
+# Windows opens descriptors in text mode (CRLF translation) without this flag.
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+# Deletes every ASCII character str.isspace() accepts, matching str.split().
+_ASCII_WS_TABLE = dict.fromkeys(c for c in range(128) if chr(c).isspace())
+
+
+def _readinto(fd, view):
+    # os.readv fills the buffer in place but is POSIX-only; elsewhere read a
+    # chunk and copy it in.
+    if hasattr(os, "readv"):
+        return os.readv(fd, [view])
+    chunk = os.read(fd, len(view))
+    view[:len(chunk)] = chunk
+    return len(chunk)
+
+
+def _read_to_eof(fd):
+    # Pseudo-files (e.g. under /proc) report a zero size, so their length is
+    # only known once the read hits EOF.
+    chunks = []
+    while chunk := os.read(fd, _READ_CHUNK):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def read_file(path, return_metadata=False):
     """
     Reads content from a file.
     
+    The file size is taken from ``fstat`` on the open descriptor so the data
+    can be read straight into a single preallocated buffer and decoded once.
+    Callers that also need the file metadata can ask for that same ``fstat``
+    result instead of stat-ing the path a second time.
+    
     Args:
         path (str): The file path to read from.
+        return_metadata (bool, optional): If True, also return the file's
+                                          ``os.stat_result``. Defaults to False.
         
     Returns:
-        str: The content of the file.
+        str or tuple: The content of the file, or a ``(content, stat_result)``
+                      tuple when return_metadata is True.
         
     Raises:
         FileNotFoundError: If the file does not exist.
         IOError: If an error occurs while reading the file.
     """
-    pass
+    fd = os.open(path, os.O_RDONLY | _O_BINARY)
+    try:
+        st = os.fstat(fd)
+        size = st.st_size
+        if size == 0:
+            buf = _read_to_eof(fd)
+        else:
+            if size > _FADVISE_THRESHOLD and hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+            buf = bytearray(size)
+            view = memoryview(buf)
+            offset = 0
+            while offset < size:
+                n = _readinto(fd, view[offset:])
+                if n == 0:
+                    break
+                offset += n
+            view.release()
+            if offset < size:
+                del buf[offset:]
+    finally:
+        os.close(fd)
+    content = buf.decode("utf-8")
+    return (content, st) if return_metadata else content
+
+
+def read_file_bytes(path):
+    """
+    Maps a file into memory and returns a read-only view of its bytes.
+    
+    Nothing is copied onto the heap up front; the OS pages data in as the
+    view is sliced, which suits large files that are only partially read.
+    The view keeps the mapping alive, and the mapping is released once the
+    view (and any slices of it) are no longer referenced. Files reporting a
+    zero size, such as pseudo-files under ``/proc``, cannot be mapped and are
+    read into memory instead.
+    
+    Args:
+        path (str): The file path to read from.
+        
+    Returns:
+        memoryview: A read-only view over the file content.
+        
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        IOError: If an error occurs while mapping the file.
+    """
+    fd = os.open(path, os.O_RDONLY | _O_BINARY)
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return memoryview(_read_to_eof(fd))
+        mapped = mmap.mmap(fd, size, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+    return memoryview(mapped)
 
 
 def write_file(path, content, append=False):
     """
     Writes or appends content to a file.
     
+    The payload is encoded once and handed to the OS with a single
+    ``os.write`` call on a raw file descriptor, bypassing the buffered
+    text I/O stack.
+    
     Args:
         path (str): The file path to write to.
-        content (str): The content to write to the file.
+        content (str or bytes-like): The content to write to the file. Strings are
+                                     encoded as UTF-8.
         append (bool, optional): If True, append to the file; if False, overwrite. 
                                 Defaults to False.
     
@@ -34,9 +133,47 @@ def write_file(path, content, append=False):
         bool: True if the operation was successful, False otherwise.
         
     Raises:
-        IOError: If an error occurs while writing to the file.
+        TypeError: If content is neither a str nor a bytes-like object. The file
+                   is left untouched in that case.
     """
-    pass
+    buf = content.encode("utf-8") if isinstance(content, str) else content
+    # Validate the payload before O_TRUNC can touch the file, and view it as
+    # raw bytes so short writes advance by the byte count os.write returns.
+    view = memoryview(buf).cast("B")
+    flags = os.O_WRONLY | os.O_CREAT | _O_BINARY | (os.O_APPEND if append else os.O_TRUNC)
+    try:
+        fd = os.open(path, flags, 0o644)
+        try:
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    except OSError:
+        return False
+    return True
+
+
+def _strip_spaces(text):
+    # str.translate is a single C pass for ASCII text but falls back to a
+    # per-character dict lookup otherwise, where split/join is faster.
+    if str.isascii(text):
+        return str.translate(text, _ASCII_WS_TABLE)
+    return "".join(str.split(text))
+
+
+def _strip_spaces_upper(text):
+    # Strip first so the case conversion runs over the shorter string.
+    return _strip_spaces(text).upper()
+
+
+# One branch-free implementation per (uppercase, remove_spaces) combination.
+# Each goes through the unbound str methods, so non-str input raises TypeError.
+_TEXT_PROCESSORS = {
+    (False, False): str.__str__,
+    (True, False): str.upper,
+    (False, True): _strip_spaces,
+    (True, True): _strip_spaces_upper,
+}
 
 
 def process_text(text, uppercase=False, remove_spaces=False):
@@ -54,7 +191,31 @@ def process_text(text, uppercase=False, remove_spaces=False):
     Raises:
         TypeError: If text is not a string.
     """
-    pass
+    if not isinstance(text, str):
+        raise TypeError(f"text must be a str, not {type(text).__name__}")
+    return _TEXT_PROCESSORS[bool(uppercase), bool(remove_spaces)](text)
+
+
+def process_texts(texts, uppercase=False, remove_spaces=False):
+    """
+    Processes many texts with the same transformations.
+    
+    The implementation for the requested flags is selected once and mapped
+    over the whole batch, instead of dispatching per call as repeated
+    ``process_text`` calls would.
+    
+    Args:
+        texts (iterable): The input texts to process.
+        uppercase (bool, optional): If True, convert text to uppercase. Defaults to False.
+        remove_spaces (bool, optional): If True, remove all whitespace. Defaults to False.
+    
+    Returns:
+        list: The processed texts, in input order.
+        
+    Raises:
+        TypeError: If any text is not a string.
+    """
+    return list(map(_TEXT_PROCESSORS[bool(uppercase), bool(remove_spaces)], texts))
 
 
 def merge_lists(*lists):
@@ -71,7 +232,7 @@ def merge_lists(*lists):
         >>> merge_lists([1, 2], [3, 4], [5, 6])
         [1, 2, 3, 4, 5, 6]
     """
-    pass
+    return list(chain.from_iterable(lists))
 
 
 def filter_data(data, key=None, reverse=False):
@@ -90,4 +251,8 @@ def filter_data(data, key=None, reverse=False):
     Raises:
         TypeError: If data is not a list.
     """
-    pass
+    if not isinstance(data, list):
+        raise TypeError(f"data must be a list, not {type(data).__name__}")
+    # sorted() evaluates key once per element, and homogeneous int/float/str
+    # keys take CPython's type-specialised comparison path.
+    return sorted(data, key=key, reverse=reverse)
@@ -2,9 +2,27 @@
 Handles asset naming conventions.
 """
 
+import sys
+
+
 class AssetNamer:
+    __slots__ = ("_prefix", "_pfx")
+
     def __init__(self, prefix):
         self.prefix = prefix
 
+    @property
+    def prefix(self):
+        return self._prefix
+
+    @prefix.setter
+    def prefix(self, value):
+        self._prefix = value
+        # The "<prefix>_" head is fixed per namer, so build it only once.
+        # Interning lets namers sharing a prefix share one string object.
+        self._pfx = sys.intern(f"{value}_")
+
     def generate_name(self, base_name):
-        return f"{self.prefix}_{base_name}"
+        if type(base_name) is str:
+            return self._pfx + base_name
+        return f"{self._pfx}{base_name}"
@@ -2,6 +2,14 @@
 Demonstrates inheritance examples with proper docstrings and class hierarchy.
 """
 
+import logging
+
+_log = logging.getLogger(__name__)
+
+# Shared immutable stand-in for a plugin store that has not been written to,
+# so tools created without plugins allocate no empty dict.
+_EMPTY_SEQ = ()
+
 
 class BaseTool:
     """
@@ -17,6 +25,8 @@ class BaseTool:
         enabled (bool): Whether the tool is enabled or disabled.
     """
     
+    __slots__ = ("name", "version", "enabled")
+    
     def __init__(self, name, version="1.0", enabled=True):
         """
         Initialize the BaseTool.
@@ -40,7 +50,7 @@ class BaseTool:
         Returns:
             str: A message describing the execution result.
         """
-        print(f"Running base tool: {self.name}")
+        _log.debug("Running base tool: %s", self.name)
         return f"Base tool {self.name} executed."
     
     def get_info(self):
@@ -71,6 +81,8 @@ class CustomTool(BaseTool):
         custom_config (dict): Custom configuration for this tool.
     """
     
+    __slots__ = ("custom_config",)
+    
     def __init__(self, name, version="1.0", enabled=True, custom_config=None):
         """
         Initialize the CustomTool.
@@ -82,7 +94,7 @@ class CustomTool(BaseTool):
             custom_config (dict, optional): Custom configuration dictionary. Defaults to None.
         """
         super().__init__(name, version, enabled)
-        self.custom_config = custom_config or {}
+        self.custom_config = custom_config if custom_config is not None else {}
     
     def run(self):
         """
@@ -91,7 +103,7 @@ class CustomTool(BaseTool):
         Returns:
             str: A message describing the custom execution result.
         """
-        print(f"Running custom tool: {self.name}")
+        _log.debug("Running custom tool: %s", self.name)
         return f"Custom tool {self.name} executed with config: {self.custom_config}"
 
 
@@ -110,6 +122,8 @@ class AdvancedTool(BaseTool):
         timeout (int): Maximum execution time in seconds.
     """
     
+    __slots__ = ("log_file", "timeout", "execution_count")
+    
     def __init__(self, name, version="2.0", enabled=True, log_file=None, timeout=30):
         """
         Initialize the AdvancedTool.
@@ -130,16 +144,32 @@ class AdvancedTool(BaseTool):
         """
         Execute the advanced tool with logging and monitoring.
         
+        Returns:
+            dict: A dictionary containing execution results and metadata.
+        """
+        return self._run_payload()
+    
+    def _run_payload(self, **extra):
+        """
+        Record an execution and build the complete run() result.
+        
+        Subclasses pass their additional result fields as keyword arguments
+        so the result dictionary is built in a single step.
+        
+        Args:
+            **extra: Additional fields to include in the result.
+        
         Returns:
             dict: A dictionary containing execution results and metadata.
         """
         self.execution_count += 1
-        print(f"Running advanced tool: {self.name}")
+        _log.debug("Running advanced tool: %s", self.name)
         return {
             "status": "success",
             "tool_name": self.name,
             "execution_count": self.execution_count,
-            "timeout": self.timeout
+            "timeout": self.timeout,
+            **extra
         }
     
     def get_stats(self):
@@ -169,9 +199,11 @@ class PluginTool(AdvancedTool):
         enabled (bool): Whether the tool is enabled.
         log_file (str): Path to the log file.
         timeout (int): Maximum execution time in seconds.
-        plugins (list): List of loaded plugins.
+        plugins (tuple): The loaded plugins.
     """
     
+    __slots__ = ("_plugins", "_snapshot")
+    
     def __init__(self, name, version="3.0", enabled=True, log_file=None, timeout=30, plugins=None):
         """
         Initialize the PluginTool.
@@ -185,7 +217,18 @@ class PluginTool(AdvancedTool):
             plugins (list, optional): List of plugins to load. Defaults to None.
         """
         super().__init__(name, version, enabled, log_file, timeout)
-        self.plugins = plugins or []
+        # An insertion-ordered dict gives O(1) duplicate checks in add_plugin.
+        self._plugins = dict.fromkeys(plugins) if plugins else _EMPTY_SEQ
+        # Immutable snapshot handed out to callers; dropped on change and
+        # rebuilt on the next read.
+        self._snapshot = None
+    
+    @property
+    def plugins(self):
+        """tuple: The loaded plugins, in the order they were added."""
+        if self._snapshot is None:
+            self._snapshot = tuple(self._plugins)
+        return self._snapshot
     
     def add_plugin(self, plugin_name):
         """
@@ -197,10 +240,13 @@ class PluginTool(AdvancedTool):
         Returns:
             bool: True if plugin was added successfully, False otherwise.
         """
-        if plugin_name not in self.plugins:
-            self.plugins.append(plugin_name)
-            return True
-        return False
+        if plugin_name in self._plugins:
+            return False
+        if self._plugins is _EMPTY_SEQ:
+            self._plugins = {}
+        self._plugins[plugin_name] = None
+        self._snapshot = None
+        return True
     
     def run(self):
         """
@@ -209,7 +255,5 @@ class PluginTool(AdvancedTool):
         Returns:
             dict: Dictionary containing execution results and plugin information.
         """
-        base_result = super().run()
-        base_result["plugins"] = self.plugins
-        base_result["plugin_count"] = len(self.plugins)
-        return base_result
+        plugins = self.plugins
+        return self._run_payload(plugins=plugins, plugin_count=len(plugins))
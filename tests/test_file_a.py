@@ -0,0 +1,154 @@
+import os
+import tempfile
+import unittest
+from array import array
+
+from module1.file_a import process_text, process_texts, read_file, read_file_bytes, write_file
+
+PROC_STATUS = "/proc/self/status"
+
+
+class WriteFileTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "out.txt")
+
+    def read_bytes(self):
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def test_writes_str_as_utf8(self):
+        self.assertTrue(write_file(self.path, "héllo\r\n"))
+        self.assertEqual(self.read_bytes(), "héllo\r\n".encode("utf-8"))
+
+    def test_overwrites_by_default_and_appends_on_request(self):
+        write_file(self.path, "first")
+        write_file(self.path, b"second")
+        self.assertEqual(self.read_bytes(), b"second")
+        self.assertTrue(write_file(self.path, "+more", append=True))
+        self.assertEqual(self.read_bytes(), b"second+more")
+
+    def test_writes_all_bytes_of_wide_buffers(self):
+        data = array("i", range(1000))
+        self.assertTrue(write_file(self.path, data))
+        self.assertEqual(self.read_bytes(), data.tobytes())
+
+    def test_returns_false_on_os_error(self):
+        missing = os.path.join(self.path, "missing", "out.txt")
+        self.assertFalse(write_file(missing, "data"))
+
+    def test_bad_content_leaves_existing_file_untouched(self):
+        write_file(self.path, "important data")
+        for bad in (None, 42, ["x"]):
+            with self.assertRaises(TypeError):
+                write_file(self.path, bad)
+        self.assertEqual(self.read_bytes(), b"important data")
+
+
+class ReadFileTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "in.txt")
+
+    def test_round_trips_write_file(self):
+        text = "h\u00e9llo\r\nw\u00f6rld\n" * 1000
+        write_file(self.path, text)
+        self.assertEqual(read_file(self.path), text)
+
+    def test_empty_file(self):
+        write_file(self.path, "")
+        self.assertEqual(read_file(self.path), "")
+
+    @unittest.skipUnless(os.path.exists(PROC_STATUS), "requires procfs")
+    def test_zero_size_pseudo_file_is_read_to_eof(self):
+        self.assertIn("Name:", read_file(PROC_STATUS))
+
+    def test_returns_metadata_from_the_same_descriptor(self):
+        write_file(self.path, "abc")
+        content, st = read_file(self.path, return_metadata=True)
+        self.assertEqual(content, "abc")
+        self.assertEqual(st.st_size, 3)
+        self.assertEqual(st.st_ino, os.stat(self.path).st_ino)
+
+    def test_missing_file_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            read_file(self.path)
+
+
+class ReadFileBytesTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "in.bin")
+
+    def test_returns_readonly_view_of_content(self):
+        write_file(self.path, b"\x00\r\nabc")
+        view = read_file_bytes(self.path)
+        self.assertTrue(view.readonly)
+        self.assertEqual(bytes(view), b"\x00\r\nabc")
+        self.assertEqual(bytes(view[2:]), b"\nabc")
+
+    def test_empty_file(self):
+        write_file(self.path, b"")
+        self.assertEqual(bytes(read_file_bytes(self.path)), b"")
+
+    @unittest.skipUnless(os.path.exists(PROC_STATUS), "requires procfs")
+    def test_zero_size_pseudo_file_is_read_to_eof(self):
+        self.assertIn(b"Name:", bytes(read_file_bytes(PROC_STATUS)))
+
+    def test_missing_file_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            read_file_bytes(self.path)
+
+
+class ProcessTextTest(unittest.TestCase):
+    SAMPLES = [
+        "",
+        "plain",
+        " a b\tc\nd\re\x0b\x0cf\x1c ",
+        "caf\u00e9 \u00e0\u3000la\u00a0carte\u2028x",
+        "stra\u00dfe  gro\u00df",
+    ]
+
+    def test_flag_combinations_match_reference(self):
+        for text in self.SAMPLES:
+            stripped = "".join(text.split())
+            expected = {
+                (False, False): text,
+                (True, False): text.upper(),
+                (False, True): stripped,
+                (True, True): stripped.upper(),
+            }
+            for (upper, strip), want in expected.items():
+                with self.subTest(text=text, uppercase=upper, remove_spaces=strip):
+                    self.assertEqual(process_text(text, upper, strip), want)
+
+    def test_removes_non_ascii_whitespace(self):
+        self.assertEqual(process_text("a\u3000b\u00a0c", remove_spaces=True), "abc")
+
+    def test_accepts_truthy_flags(self):
+        self.assertEqual(process_text("a b", uppercase=1, remove_spaces="yes"), "AB")
+
+    def test_rejects_non_str(self):
+        with self.assertRaises(TypeError):
+            process_text(b"bytes")
+
+    def test_process_texts_matches_process_text(self):
+        for upper in (False, True):
+            for strip in (False, True):
+                self.assertEqual(
+                    process_texts(iter(self.SAMPLES), upper, strip),
+                    [process_text(t, upper, strip) for t in self.SAMPLES],
+                )
+
+    def test_process_texts_rejects_non_str_items(self):
+        for upper in (False, True):
+            for strip in (False, True):
+                with self.assertRaises(TypeError):
+                    process_texts(["ok", 3], upper, strip)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import copy
+import pickle
+import unittest
+
+from module3.file_f import BaseTool, CustomTool, PluginTool
+
+
+class BaseToolTest(unittest.TestCase):
+    def test_get_info_reflects_attribute_changes(self):
+        tool = BaseTool("base")
+        tool.enabled = False
+        self.assertEqual(tool.get_info(), {"name": "base", "version": "1.0", "enabled": False})
+
+
+class CustomToolTest(unittest.TestCase):
+    def test_default_config_is_a_mutable_dict(self):
+        tool = CustomTool("custom")
+        tool.custom_config["key"] = "value"
+        self.assertEqual(tool.run(), "Custom tool custom executed with config: {'key': 'value'}")
+
+
+class PluginToolTest(unittest.TestCase):
+    def test_add_plugin_dedupes_and_keeps_order(self):
+        tool = PluginTool("plug", plugins=["a", "b", "a"])
+        self.assertTrue(tool.add_plugin("c"))
+        self.assertFalse(tool.add_plugin("b"))
+        self.assertEqual(tool.plugins, ("a", "b", "c"))
+
+    def test_add_plugin_without_initial_plugins(self):
+        tool = PluginTool("plug")
+        other = PluginTool("other")
+        self.assertEqual(tool.plugins, ())
+        self.assertTrue(tool.add_plugin("a"))
+        self.assertFalse(tool.add_plugin("a"))
+        self.assertEqual(tool.plugins, ("a",))
+        self.assertEqual(other.plugins, ())
+
+    def test_run_reports_plugins(self):
+        tool = PluginTool("plug", plugins=["a"])
+        tool.run()
+        tool.add_plugin("b")
+        result = tool.run()
+        self.assertEqual(result["plugins"], ("a", "b"))
+        self.assertEqual(result["plugin_count"], 2)
+        self.assertEqual(result["execution_count"], 2)
+
+    def test_copy_and_pickle(self):
+        for plugins in (None, ["a"]):
+            tool = PluginTool("plug", plugins=plugins)
+            for clone in (copy.deepcopy(tool), pickle.loads(pickle.dumps(tool))):
+                self.assertEqual(clone.plugins, tool.plugins)
+                self.assertTrue(clone.add_plugin("b"))
+                self.assertNotIn("b", tool.plugins)
+
+
+if __name__ == "__main__":
+    unittest.main()